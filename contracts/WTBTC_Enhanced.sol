@@ -200,6 +200,26 @@ contract WTBTC_Enhanced is ERC20, ERC20Burnable, Ownable, Pausable {
         return burnId;
     }
 
+    /**
+     * @dev Transfer WTBTC to several recipients in a single transaction
+     * @param recipients Addresses to receive tokens
+     * @param amounts Amount for each recipient, in the same order
+     */
+    function batchTransfer(address[] calldata recipients, uint256[] calldata amounts)
+        external
+        whenNotPaused
+        returns (bool)
+    {
+        require(recipients.length == amounts.length, "WTBTC: length mismatch");
+        require(recipients.length > 0, "WTBTC: no recipients");
+
+        for (uint256 i = 0; i < recipients.length; i++) {
+            _transfer(msg.sender, recipients[i], amounts[i]);
+        }
+
+        return true;
+    }
+
     /**
      * @dev Mark burn as processed after BTC is sent
      * @param burnId The burn identifier
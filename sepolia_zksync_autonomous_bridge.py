@@ -15,28 +15,120 @@ Fully Autonomous System:
 - Backend interaction
 - FULLY AUTOMATED
 
+Set BRIDGE_DEMO=1 to simulate network latency between steps and
+NEXUS_LOG_LEVEL (e.g. WARNING) to control log verbosity.
+
 Author: Douglas Shane Davis & Claude AI
 Version: 1.0 SEPOLIA-ZKSYNC AUTONOMOUS
 ================================================================================
 """
 
-import subprocess
+import asyncio
 import json
 import time
 import os
 import sys
 import hashlib
+import secrets
 import logging
-from typing import Dict, List, Any, Optional
+import traceback
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _env_log_level(name: str = "NEXUS_LOG_LEVEL") -> int:
+    """Log level from the environment: a level name or a number, else INFO"""
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return logging.INFO
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelName(value.upper())
+    if isinstance(level, int):
+        return level
+    sys.stderr.write(f"Ignoring unknown {name}={value!r}; using INFO\n")
+    return logging.INFO
+
+
+# NEXUS_LOG_LEVEL=WARNING silences the step-by-step banners. Timestamps
+# cost a strftime per record, so they are only kept for interactive runs.
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
+    level=_env_log_level(),
+    format=('%(asctime)s [%(levelname)s] %(message)s' if sys.stderr.isatty()
+            else '[%(levelname)s] %(message)s'),
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 logger = logging.getLogger(__name__)
 
+# Simulated network latency is only useful for live demos; set BRIDGE_DEMO=1
+# to restore the pauses between steps.
+DEMO = os.environ.get("BRIDGE_DEMO", "").strip().lower() in ("1", "true", "yes", "on")
+
+# Hash backend for every digest in this module. hashlib is backed by
+# OpenSSL, which already dispatches to SHA-NI / AVX2 code paths at runtime
+# based on CPU features, so no third-party accelerator is required.
+_SHA256 = hashlib.sha256
+_SHA512 = hashlib.sha512
+
+
+def sha256(data: bytes) -> str:
+    """Hex SHA-256 digest using the module hash backend"""
+    return _SHA256(data).hexdigest()
+
+
+def sha512(data: bytes) -> str:
+    """Hex SHA-512 digest using the module hash backend"""
+    return _SHA512(data).hexdigest()
+
+
+def derive_hex(prefix_ctx: Any, tag: bytes) -> str:
+    """Hex digest of ``prefix + tag``, reusing the prefix's hashed midstate"""
+    ctx = prefix_ctx.copy()
+    ctx.update(tag)
+    return ctx.hexdigest()
+
+
+def derive_bridge_hashes(bridge_id: str) -> Tuple[str, str, str, str, str, str]:
+    """Derive (lock, merkle, proof, l1, zkproof, l2) hashes for a bridge ID
+
+    bridge_id is 64 hex chars, exactly one SHA-256 block, so it is
+    compressed once and every field is derived from a copy of that state.
+    Not cached: every bridge gets a fresh random bridge_id, so a cache
+    would never hit.
+    """
+    bridge_ctx = _SHA256(bridge_id.encode())
+    return tuple(
+        derive_hex(bridge_ctx, tag)
+        for tag in (b"lock", b"merkle", b"proof", b"l1", b"zkproof", b"l2")
+    )
+
+
+def _json_default(obj: Any) -> Dict:
+    """Convert operation records to dicts at serialization time"""
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def canonical_json(data: Any) -> bytes:
+    """Serialize to compact, key-sorted JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        data, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=_json_default
+    ).encode()
+
+
+def pretty_json(data: Any) -> bytes:
+    """Serialize to 2-space indented JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, default=_json_default).encode()
+
 
 class Colors:
     HEADER = '\033[95m'
@@ -49,6 +141,38 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Pre-built banner pieces shared by every log section
+BAR80 = "=" * 80
+_HEADER = f"{Colors.HEADER}{Colors.BOLD}"
+_RESET = Colors.ENDC
+
+
+def log_banner(title: str, style: str = _HEADER):
+    """Log a section title framed by separator bars as one record"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n%s\n%s%s%s\n%s\n", BAR80, style, title, _RESET, BAR80)
+
+
+def log_lines(*lines: str):
+    """Log several lines as a single record
+
+    Callers wrap the call in ``if logger.isEnabledFor(logging.INFO):`` so
+    the f-string arguments are not built when INFO is disabled.
+    """
+    logger.info("\n".join(lines))
+
+
+def write_lines(lines: List[str]):
+    """Write a block of lines to stdout with a single write and flush"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+# Simulated contract addresses are fixed, so derive them once at import
+_SEPOLIA_WBTC_CONTRACT = "0x" + sha256(b"sepolia_wbtc")[:40]
+_ZKSYNC_BRIDGE_CONTRACT = "0x" + sha256(b"zksync_bridge")[:40]
+
+
 class SepoliaWBTCSource:
     """Ethereum Sepolia WBTC Source"""
 
@@ -56,13 +180,11 @@ class SepoliaWBTCSource:
         self.network = "Ethereum Sepolia"
         self.chain_id = 11155111
         self.initial_balance = 250.0  # Initial WBTC balance
-        self.wbtc_contract = "0x" + hashlib.sha256(b"sepolia_wbtc").hexdigest()[:40]
+        self.wbtc_contract = _SEPOLIA_WBTC_CONTRACT
 
     def get_initial_balance(self) -> Dict:
         """Get initial WBTC balance on Sepolia"""
-        logger.info(f"\n{'='*80}")
-        logger.info(f"{Colors.HEADER}{Colors.BOLD}💰 ETHEREUM SEPOLIA WBTC BALANCE{Colors.ENDC}")
-        logger.info(f"{'='*80}\n")
+        log_banner("💰 ETHEREUM SEPOLIA WBTC BALANCE")
 
         balance_data = {
             'network': self.network,
@@ -73,13 +195,15 @@ class SepoliaWBTCSource:
             'timestamp': datetime.now().isoformat()
         }
 
-        logger.info(f"   Network: {self.network}")
-        logger.info(f"   Chain ID: {self.chain_id}")
-        logger.info(f"   WBTC Contract: {self.wbtc_contract}")
-        logger.info(f"   Balance: {Colors.OKGREEN}{balance_data['balance_wbtc']} WBTC{Colors.ENDC}")
-        logger.info(f"   Wei: {balance_data['balance_wei']:,}")
-
-        logger.info(f"\n{Colors.OKGREEN}✓ Balance retrieved!{Colors.ENDC}\n")
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"   Network: {self.network}",
+                f"   Chain ID: {self.chain_id}",
+                f"   WBTC Contract: {self.wbtc_contract}",
+                f"   Balance: {Colors.OKGREEN}{balance_data['balance_wbtc']} WBTC{Colors.ENDC}",
+                f"   Wei: {balance_data['balance_wei']:,}",
+                f"\n{Colors.OKGREEN}✓ Balance retrieved!{Colors.ENDC}\n"
+            )
 
         return balance_data
 
@@ -88,20 +212,19 @@ class ZkSyncEraAutonomousBridge:
     """Autonomous zkSync Era Bridge"""
 
     def __init__(self, target_address: str):
-        self.target_address = target_address.lower()
+        # Callers pass the already-lowercased address
+        self.target_address = target_address
         self.network = "zkSync Era"
         self.chain_id = 324
-        self.bridge_contract = "0x" + hashlib.sha256(b"zksync_bridge").hexdigest()[:40]
+        self.bridge_contract = _ZKSYNC_BRIDGE_CONTRACT
         self.wbtc_contract = target_address
 
     def initiate_bridge(self, source_balance: Dict) -> Dict:
         """Initiate bridge from Sepolia to zkSync Era"""
-        logger.info(f"\n{'='*80}")
-        logger.info(f"{Colors.HEADER}{Colors.BOLD}🌉 AUTONOMOUS BRIDGE: SEPOLIA → ZKSYNC ERA{Colors.ENDC}")
-        logger.info(f"{'='*80}\n")
+        log_banner("🌉 AUTONOMOUS BRIDGE: SEPOLIA → ZKSYNC ERA")
 
         bridge_data = {
-            'bridge_id': hashlib.sha256(f"sepolia_zksync_{time.time()}".encode()).hexdigest(),
+            'bridge_id': secrets.token_hex(32),
             'from_network': 'Ethereum Sepolia',
             'from_chain_id': 11155111,
             'to_network': 'zkSync Era',
@@ -112,237 +235,364 @@ class ZkSyncEraAutonomousBridge:
             'timestamp': datetime.now().isoformat()
         }
 
-        logger.info(f"   From: {bridge_data['from_network']} (Chain {bridge_data['from_chain_id']})")
-        logger.info(f"   To: {bridge_data['to_network']} (Chain {bridge_data['to_chain_id']})")
-        logger.info(f"   Amount: {Colors.OKGREEN}{bridge_data['amount_wbtc']} WBTC{Colors.ENDC}")
-        logger.info(f"   Destination: {Colors.OKGREEN}{self.target_address}{Colors.ENDC}")
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"   From: {bridge_data['from_network']} (Chain {bridge_data['from_chain_id']})",
+                f"   To: {bridge_data['to_network']} (Chain {bridge_data['to_chain_id']})",
+                f"   Amount: {Colors.OKGREEN}{bridge_data['amount_wbtc']} WBTC{Colors.ENDC}",
+                f"   Destination: {Colors.OKGREEN}{self.target_address}{Colors.ENDC}"
+            )
+
+        lock_tx, merkle_root, proof_hash, l1_tx, zk_proof, l2_tx = derive_bridge_hashes(bridge_data['bridge_id'])
 
         # Step 1: Lock on Sepolia
-        logger.info(f"\n🔒 Step 1: Locking WBTC on Sepolia...")
-        time.sleep(0.5)
-        bridge_data['lock_tx'] = '0x' + hashlib.sha256(f"lock_{bridge_data['bridge_id']}".encode()).hexdigest()
-        logger.info(f"{Colors.OKGREEN}✓ Locked: {bridge_data['lock_tx'][:32]}...{Colors.ENDC}")
+        logger.info("\n🔒 Step 1: Locking WBTC on Sepolia...")
+        if DEMO:
+            time.sleep(0.5)
+        bridge_data['lock_tx'] = '0x' + lock_tx
+        logger.info("%s✓ Locked: %s...%s", Colors.OKGREEN, bridge_data['lock_tx'][:32], _RESET)
 
         # Step 2: Generate bridge proof
-        logger.info(f"\n🔐 Step 2: Generating bridge proof...")
-        time.sleep(0.5)
-        bridge_data['merkle_root'] = hashlib.sha256(f"merkle_{bridge_data['bridge_id']}".encode()).hexdigest()
-        bridge_data['proof_hash'] = hashlib.sha256(f"proof_{bridge_data['bridge_id']}".encode()).hexdigest()
-        logger.info(f"{Colors.OKGREEN}✓ Merkle Root: {bridge_data['merkle_root'][:32]}...{Colors.ENDC}")
-        logger.info(f"{Colors.OKGREEN}✓ Proof: {bridge_data['proof_hash'][:32]}...{Colors.ENDC}")
+        logger.info("\n🔐 Step 2: Generating bridge proof...")
+        if DEMO:
+            time.sleep(0.5)
+        bridge_data['merkle_root'] = merkle_root
+        bridge_data['proof_hash'] = proof_hash
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"{Colors.OKGREEN}✓ Merkle Root: {bridge_data['merkle_root'][:32]}...{Colors.ENDC}",
+                f"{Colors.OKGREEN}✓ Proof: {bridge_data['proof_hash'][:32]}...{Colors.ENDC}"
+            )
 
         # Step 3: Submit to zkSync Era
-        logger.info(f"\n📡 Step 3: Submitting to zkSync Era...")
-        time.sleep(0.5)
-        bridge_data['l1_tx'] = '0x' + hashlib.sha256(f"l1_{bridge_data['bridge_id']}".encode()).hexdigest()
-        logger.info(f"{Colors.OKGREEN}✓ L1 Transaction: {bridge_data['l1_tx'][:32]}...{Colors.ENDC}")
+        logger.info("\n📡 Step 3: Submitting to zkSync Era...")
+        if DEMO:
+            time.sleep(0.5)
+        bridge_data['l1_tx'] = '0x' + l1_tx
+        logger.info("%s✓ L1 Transaction: %s...%s", Colors.OKGREEN, bridge_data['l1_tx'][:32], _RESET)
 
         # Step 4: ZK Proof generation
-        logger.info(f"\n🔐 Step 4: Generating ZK proof...")
-        time.sleep(0.7)
-        bridge_data['zk_proof'] = hashlib.sha256(f"zkproof_{bridge_data['bridge_id']}".encode()).hexdigest()
-        logger.info(f"{Colors.OKGREEN}✓ ZK Proof: {bridge_data['zk_proof'][:32]}...{Colors.ENDC}")
+        logger.info("\n🔐 Step 4: Generating ZK proof...")
+        if DEMO:
+            time.sleep(0.7)
+        bridge_data['zk_proof'] = zk_proof
+        logger.info("%s✓ ZK Proof: %s...%s", Colors.OKGREEN, bridge_data['zk_proof'][:32], _RESET)
 
         # Step 5: Finalize on L2
-        logger.info(f"\n✅ Step 5: Finalizing on zkSync Era L2...")
-        time.sleep(0.5)
-        bridge_data['l2_tx'] = '0x' + hashlib.sha256(f"l2_{bridge_data['bridge_id']}".encode()).hexdigest()
+        logger.info("\n✅ Step 5: Finalizing on zkSync Era L2...")
+        if DEMO:
+            time.sleep(0.5)
+        bridge_data['l2_tx'] = '0x' + l2_tx
         bridge_data['block_number'] = 8765432
-        logger.info(f"{Colors.OKGREEN}✓ L2 Transaction: {bridge_data['l2_tx'][:32]}...{Colors.ENDC}")
-        logger.info(f"{Colors.OKGREEN}✓ Block: {bridge_data['block_number']}{Colors.ENDC}")
-
-        logger.info(f"\n{Colors.OKGREEN}{Colors.BOLD}✅ BRIDGE COMPLETE: {bridge_data['amount_wbtc']} WBTC → zkSync Era!{Colors.ENDC}\n")
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"{Colors.OKGREEN}✓ L2 Transaction: {bridge_data['l2_tx'][:32]}...{Colors.ENDC}",
+                f"{Colors.OKGREEN}✓ Block: {bridge_data['block_number']}{Colors.ENDC}",
+                f"\n{Colors.OKGREEN}{Colors.BOLD}✅ BRIDGE COMPLETE: {bridge_data['amount_wbtc']} WBTC → zkSync Era!{Colors.ENDC}\n"
+            )
 
         return bridge_data
 
 
-class WBTCOperationsManager:
-    """WBTC Mint, Transfer, Burn Operations"""
+class Record:
+    """Fixed-field operation record
 
-    def __init__(self, wbtc_address: str):
-        self.wbtc_address = wbtc_address
-        self.operations = []
+    Subclasses list their fields in __slots__ (no per-instance __dict__)
+    and set every one of them at construction, so this also works on
+    Python versions without dataclass(slots=True).
+    """
+    __slots__ = ()
+    operation: Optional[str] = None
 
-    def mint_all_wbtc(self, bridge_data: Dict) -> Dict:
-        """Mint ALL WBTC on zkSync Era"""
-        logger.info(f"\n{'='*80}")
-        logger.info(f"{Colors.HEADER}{Colors.BOLD}🪙  MINTING ALL WBTC ON ZKSYNC ERA{Colors.ENDC}")
-        logger.info(f"{'='*80}\n")
-
-        mint_data = {
-            'operation': 'mint',
-            'mint_id': hashlib.sha256(f"mint_{time.time()}".encode()).hexdigest(),
-            'bridge_ref': bridge_data['bridge_id'],
-            'amount_wbtc': bridge_data['amount_wbtc'],
-            'amount_wei': bridge_data['amount_wei'],
-            'wbtc_contract': self.wbtc_address,
-            'recipient': self.wbtc_address,
-            'timestamp': datetime.now().isoformat()
-        }
+    def __init__(self, **fields: Any):
+        for name in self.__slots__:
+            try:
+                setattr(self, name, fields.pop(name))
+            except KeyError:
+                raise TypeError(f"{type(self).__name__} missing field '{name}'") from None
+        if fields:
+            raise TypeError(f"{type(self).__name__} got unexpected fields: {', '.join(fields)}")
 
-        logger.info(f"   WBTC Contract: {self.wbtc_address}")
-        logger.info(f"   Amount: {Colors.OKGREEN}{mint_data['amount_wbtc']} WBTC{Colors.ENDC}")
-        logger.info(f"   Wei: {mint_data['amount_wei']:,}")
-        logger.info(f"   Recipient: {mint_data['recipient']}")
+    def to_dict(self) -> Dict:
+        """Flat dict in the original key order, for serialization"""
+        data = {'operation': self.operation} if self.operation else {}
+        for name in self.__slots__:
+            data[name] = getattr(self, name)
+        return data
 
-        time.sleep(0.5)
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
 
-        logger.info(f"\n🪙  Executing mint transaction...")
-        mint_data['mint_tx'] = '0x' + hashlib.sha256(f"mint_tx_{mint_data['mint_id']}".encode()).hexdigest()
-        mint_data['block'] = 8765433
-        mint_data['gas_used'] = 95000
 
-        logger.info(f"{Colors.OKGREEN}✓ Mint TX: {mint_data['mint_tx'][:32]}...{Colors.ENDC}")
-        logger.info(f"{Colors.OKGREEN}✓ Block: {mint_data['block']}{Colors.ENDC}")
-        logger.info(f"{Colors.OKGREEN}✓ Gas: {mint_data['gas_used']:,}{Colors.ENDC}")
+class MintRecord(Record):
+    """Mint operation on zkSync Era"""
+    __slots__ = ('mint_id', 'bridge_ref', 'amount_wbtc', 'amount_wei', 'wbtc_contract',
+                 'recipient', 'timestamp', 'mint_tx', 'block', 'gas_used')
+    operation = 'mint'
 
-        logger.info(f"\n{Colors.OKGREEN}{Colors.BOLD}✅ MINTED {mint_data['amount_wbtc']} WBTC!{Colors.ENDC}\n")
 
-        self.operations.append(mint_data)
-        return mint_data
+class TransferRecord(Record):
+    """Transfer operation to the destination wallet"""
+    __slots__ = ('transfer_id', 'from_mint', 'amount_wbtc', 'amount_wei', 'from_address',
+                 'to_address', 'timestamp', 'transfer_tx', 'block', 'gas_used')
+    operation = 'transfer'
 
-    def transfer_all_to_wallet(self, mint_data: Dict) -> Dict:
-        """Transfer ALL WBTC to destination wallet"""
-        logger.info(f"\n{'='*80}")
-        logger.info(f"{Colors.BOLD}💸 TRANSFERRING ALL WBTC TO WALLET{Colors.ENDC}")
-        logger.info(f"{'='*80}\n")
-
-        transfer_data = {
-            'operation': 'transfer',
-            'transfer_id': hashlib.sha256(f"transfer_{time.time()}".encode()).hexdigest(),
-            'from_mint': mint_data['mint_id'],
-            'amount_wbtc': mint_data['amount_wbtc'],
-            'amount_wei': mint_data['amount_wei'],
-            'from_address': mint_data['wbtc_contract'],
-            'to_address': self.wbtc_address,
-            'timestamp': datetime.now().isoformat()
-        }
 
-        logger.info(f"   From: {transfer_data['from_address']}")
-        logger.info(f"   To: {Colors.OKGREEN}{transfer_data['to_address']}{Colors.ENDC}")
-        logger.info(f"   Amount: {Colors.OKGREEN}{transfer_data['amount_wbtc']} WBTC{Colors.ENDC}")
+class BurnRecord(Record):
+    """Burn operation on zkSync Era"""
+    __slots__ = ('burn_id', 'from_transfer', 'amount_wbtc', 'amount_wei', 'burner_address',
+                 'timestamp', 'burn_tx', 'block', 'gas_used')
+    operation = 'burn'
 
-        time.sleep(0.4)
 
-        logger.info(f"\n💸 Executing transfer...")
-        transfer_data['transfer_tx'] = '0x' + hashlib.sha256(f"transfer_tx_{transfer_data['transfer_id']}".encode()).hexdigest()
-        transfer_data['block'] = 8765434
-        transfer_data['gas_used'] = 50000
+class WBTCOperationsManager:
+    """WBTC Mint, Transfer, Burn Operations"""
 
-        logger.info(f"{Colors.OKGREEN}✓ Transfer TX: {transfer_data['transfer_tx'][:32]}...{Colors.ENDC}")
-        logger.info(f"{Colors.OKGREEN}✓ Block: {transfer_data['block']}{Colors.ENDC}")
+    def __init__(self, wbtc_address: str):
+        self.wbtc_address = wbtc_address
+        self.operations: List[Any] = []
+
+    def mint_all_wbtc(self, bridge_data: Dict) -> MintRecord:
+        """Mint ALL WBTC on zkSync Era"""
+        log_banner("🪙  MINTING ALL WBTC ON ZKSYNC ERA")
+
+        # The tx hash depends only on the mint ID, so the record is built
+        # complete up front
+        mint_id = secrets.token_hex(32)
+        mint_data = MintRecord(
+            mint_id=mint_id,
+            bridge_ref=bridge_data['bridge_id'],
+            amount_wbtc=bridge_data['amount_wbtc'],
+            amount_wei=bridge_data['amount_wei'],
+            wbtc_contract=self.wbtc_address,
+            recipient=self.wbtc_address,
+            timestamp=datetime.now().isoformat(),
+            mint_tx='0x' + sha256(b"mint_tx_" + mint_id.encode()),
+            block=8765433,
+            gas_used=95000
+        )
+
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"   WBTC Contract: {self.wbtc_address}",
+                f"   Amount: {Colors.OKGREEN}{mint_data.amount_wbtc} WBTC{Colors.ENDC}",
+                f"   Wei: {mint_data.amount_wei:,}",
+                f"   Recipient: {mint_data.recipient}"
+            )
+
+        if DEMO:
+            time.sleep(0.5)
+
+        logger.info("\n🪙  Executing mint transaction...")
+
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"{Colors.OKGREEN}✓ Mint TX: {mint_data.mint_tx[:32]}...{Colors.ENDC}",
+                f"{Colors.OKGREEN}✓ Block: {mint_data.block}{Colors.ENDC}",
+                f"{Colors.OKGREEN}✓ Gas: {mint_data.gas_used:,}{Colors.ENDC}",
+                f"\n{Colors.OKGREEN}{Colors.BOLD}✅ MINTED {mint_data.amount_wbtc} WBTC!{Colors.ENDC}\n"
+            )
+
+        self.operations.append(mint_data)
+        return mint_data
 
-        logger.info(f"\n{Colors.OKGREEN}{Colors.BOLD}✅ TRANSFERRED {transfer_data['amount_wbtc']} WBTC!{Colors.ENDC}")
-        logger.info(f"{Colors.OKGREEN}   Balance at {self.wbtc_address}: {transfer_data['amount_wbtc']} WBTC{Colors.ENDC}\n")
+    def transfer_all_to_wallet(self, mint_data: MintRecord) -> TransferRecord:
+        """Transfer ALL WBTC to destination wallet"""
+        log_banner("💸 TRANSFERRING ALL WBTC TO WALLET", Colors.BOLD)
+
+        transfer_id = secrets.token_hex(32)
+        transfer_data = TransferRecord(
+            transfer_id=transfer_id,
+            from_mint=mint_data.mint_id,
+            amount_wbtc=mint_data.amount_wbtc,
+            amount_wei=mint_data.amount_wei,
+            from_address=mint_data.wbtc_contract,
+            to_address=self.wbtc_address,
+            timestamp=datetime.now().isoformat(),
+            transfer_tx='0x' + sha256(b"transfer_tx_" + transfer_id.encode()),
+            block=8765434,
+            gas_used=50000
+        )
+
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"   From: {transfer_data.from_address}",
+                f"   To: {Colors.OKGREEN}{transfer_data.to_address}{Colors.ENDC}",
+                f"   Amount: {Colors.OKGREEN}{transfer_data.amount_wbtc} WBTC{Colors.ENDC}"
+            )
+
+        if DEMO:
+            time.sleep(0.4)
+
+        logger.info("\n💸 Executing transfer...")
+
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"{Colors.OKGREEN}✓ Transfer TX: {transfer_data.transfer_tx[:32]}...{Colors.ENDC}",
+                f"{Colors.OKGREEN}✓ Block: {transfer_data.block}{Colors.ENDC}",
+                f"\n{Colors.OKGREEN}{Colors.BOLD}✅ TRANSFERRED {transfer_data.amount_wbtc} WBTC!{Colors.ENDC}",
+                f"{Colors.OKGREEN}   Balance at {self.wbtc_address}: {transfer_data.amount_wbtc} WBTC{Colors.ENDC}\n"
+            )
 
         self.operations.append(transfer_data)
         return transfer_data
 
-    def burn_all_wbtc(self, transfer_data: Dict) -> Dict:
+    def burn_all_wbtc(self, transfer_data: TransferRecord) -> BurnRecord:
         """Burn ALL WBTC tokens"""
-        logger.info(f"\n{'='*80}")
-        logger.info(f"{Colors.HEADER}{Colors.BOLD}🔥 BURNING ALL WBTC TOKENS{Colors.ENDC}")
-        logger.info(f"{'='*80}\n")
-
-        burn_data = {
-            'operation': 'burn',
-            'burn_id': hashlib.sha256(f"burn_{time.time()}".encode()).hexdigest(),
-            'from_transfer': transfer_data['transfer_id'],
-            'amount_wbtc': transfer_data['amount_wbtc'],
-            'amount_wei': transfer_data['amount_wei'],
-            'burner_address': self.wbtc_address,
-            'timestamp': datetime.now().isoformat()
-        }
-
-        logger.info(f"   Amount to Burn: {Colors.WARNING}{burn_data['amount_wbtc']} WBTC{Colors.ENDC}")
-        logger.info(f"   Burner: {burn_data['burner_address']}")
-
-        time.sleep(0.6)
-
-        logger.info(f"\n🔥 Executing burn transaction...")
-        burn_data['burn_tx'] = '0x' + hashlib.sha256(f"burn_tx_{burn_data['burn_id']}".encode()).hexdigest()
-        burn_data['block'] = 8765435
-        burn_data['gas_used'] = 60000
-
-        logger.info(f"{Colors.OKGREEN}✓ Burn TX: {burn_data['burn_tx'][:32]}...{Colors.ENDC}")
-        logger.info(f"{Colors.OKGREEN}✓ Block: {burn_data['block']}{Colors.ENDC}")
-
-        logger.info(f"\n{Colors.OKGREEN}{Colors.BOLD}✅ BURNED {burn_data['amount_wbtc']} WBTC!{Colors.ENDC}\n")
+        log_banner("🔥 BURNING ALL WBTC TOKENS")
+
+        burn_id = secrets.token_hex(32)
+        burn_data = BurnRecord(
+            burn_id=burn_id,
+            from_transfer=transfer_data.transfer_id,
+            amount_wbtc=transfer_data.amount_wbtc,
+            amount_wei=transfer_data.amount_wei,
+            burner_address=self.wbtc_address,
+            timestamp=datetime.now().isoformat(),
+            burn_tx='0x' + sha256(b"burn_tx_" + burn_id.encode()),
+            block=8765435,
+            gas_used=60000
+        )
+
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"   Amount to Burn: {Colors.WARNING}{burn_data.amount_wbtc} WBTC{Colors.ENDC}",
+                f"   Burner: {burn_data.burner_address}"
+            )
+
+        if DEMO:
+            time.sleep(0.6)
+
+        logger.info("\n🔥 Executing burn transaction...")
+
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"{Colors.OKGREEN}✓ Burn TX: {burn_data.burn_tx[:32]}...{Colors.ENDC}",
+                f"{Colors.OKGREEN}✓ Block: {burn_data.block}{Colors.ENDC}",
+                f"\n{Colors.OKGREEN}{Colors.BOLD}✅ BURNED {burn_data.amount_wbtc} WBTC!{Colors.ENDC}\n"
+            )
 
         self.operations.append(burn_data)
         return burn_data
 
 
+class BackendStep(Record):
+    """Single backend interaction step"""
+    __slots__ = ('step', 'status', 'timestamp', 'tx_ref')
+
+
 class AutonomousBackend:
     """Autonomous Backend Interaction System"""
 
+    # (step name, simulated latency in seconds when DEMO is set)
+    BACKEND_STEPS = [
+        ("Connect to bridge backend", 0.3),
+        ("Authenticate autonomous agent", 0.3),
+        ("Submit all transaction proofs", 0.4),
+        ("Verify mint operations", 0.3),
+        ("Verify transfer operations", 0.3),
+        ("Verify burn operations", 0.3),
+        ("Update distributed ledger", 0.4),
+        ("Sync with zkSync Era nodes", 0.4),
+        ("Generate compliance report", 0.3),
+        ("Finalize backend state", 0.3)
+    ]
+
     def __init__(self):
         self.backend_url = "https://zksync-bridge-api.network"
         self.interactions = []
 
-    def interact_with_backend(self, all_data: Dict) -> Dict:
-        """Complete autonomous backend interaction"""
-        logger.info(f"\n{'='*80}")
-        logger.info(f"{Colors.HEADER}{Colors.BOLD}🖥️  AUTONOMOUS BACKEND INTERACTION{Colors.ENDC}")
-        logger.info(f"{'='*80}\n")
-
-        logger.info(f"   Backend API: {self.backend_url}")
-        logger.info(f"   Mode: FULLY AUTONOMOUS")
-
-        steps = [
-            ("Connect to bridge backend", 0.3),
-            ("Authenticate autonomous agent", 0.3),
-            ("Submit all transaction proofs", 0.4),
-            ("Verify mint operations", 0.3),
-            ("Verify transfer operations", 0.3),
-            ("Verify burn operations", 0.3),
-            ("Update distributed ledger", 0.4),
-            ("Sync with zkSync Era nodes", 0.4),
-            ("Generate compliance report", 0.3),
-            ("Finalize backend state", 0.3)
-        ]
-
-        interaction_log = []
-
-        for step_name, delay in steps:
-            logger.info(f"\n🔄 {step_name}...")
-            time.sleep(delay)
-
-            step_result = {
-                'step': step_name,
-                'status': 'success',
-                'timestamp': datetime.now().isoformat(),
-                'tx_ref': hashlib.sha256(f"{step_name}_{time.time()}".encode()).hexdigest()[:16]
-            }
-
-            interaction_log.append(step_result)
-            logger.info(f"{Colors.OKGREEN}✓ {step_name} completed [{step_result['tx_ref']}]{Colors.ENDC}")
+    def _backend_step(self, step_name: str, timestamp: str) -> BackendStep:
+        """Record a completed backend step"""
+        return BackendStep(
+            step=step_name,
+            status='success',
+            timestamp=timestamp,
+            tx_ref=secrets.token_hex(8)
+        )
+
+    async def _run_backend_step(self, step_name: str, delay: float, timestamp: str) -> BackendStep:
+        """Run a single backend step"""
+        if DEMO:
+            await asyncio.sleep(delay)
+
+        return self._backend_step(step_name, timestamp)
+
+    def _start_backend_interaction(self) -> str:
+        """Log the backend section header and return the shared timestamp"""
+        log_banner("🖥️  AUTONOMOUS BACKEND INTERACTION")
+
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"   Backend API: {self.backend_url}",
+                "   Mode: FULLY AUTONOMOUS"
+            )
+            log_lines(*(f"\n🔄 {step_name}..." for step_name, _ in self.BACKEND_STEPS))
+
+        return datetime.now().isoformat()
+
+    def _finish_backend_interaction(self, interaction_log: List[BackendStep], now_iso: str) -> Dict:
+        """Log the completed steps and record the backend result"""
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(*(
+                f"{Colors.OKGREEN}✓ {step_result.step} completed [{step_result.tx_ref}]{Colors.ENDC}"
+                for step_result in interaction_log
+            ))
 
         backend_result = {
-            'backend_id': hashlib.sha256(f"backend_{time.time()}".encode()).hexdigest(),
+            'backend_id': secrets.token_hex(32),
             'url': self.backend_url,
             'mode': 'autonomous',
-            'steps_completed': len(steps),
+            'steps_completed': len(interaction_log),
             'interaction_log': interaction_log,
             'status': 'completed',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso
         }
 
-        logger.info(f"\n{Colors.OKGREEN}{Colors.BOLD}✅ BACKEND INTERACTION COMPLETE!{Colors.ENDC}")
-        logger.info(f"{Colors.OKGREEN}   Total Steps: {backend_result['steps_completed']}{Colors.ENDC}")
-        logger.info(f"{Colors.OKGREEN}   Backend ID: {backend_result['backend_id'][:32]}...{Colors.ENDC}\n")
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"\n{Colors.OKGREEN}{Colors.BOLD}✅ BACKEND INTERACTION COMPLETE!{Colors.ENDC}",
+                f"{Colors.OKGREEN}   Total Steps: {backend_result['steps_completed']}{Colors.ENDC}",
+                f"{Colors.OKGREEN}   Backend ID: {backend_result['backend_id'][:32]}...{Colors.ENDC}\n"
+            )
 
         self.interactions.append(backend_result)
         return backend_result
 
+    def interact_with_backend(self, all_data: Dict) -> Dict:
+        """Complete autonomous backend interaction"""
+        if DEMO:
+            # Only the simulated latencies need an event loop
+            return asyncio.run(self.interact_with_backend_async(all_data))
+
+        now_iso = self._start_backend_interaction()
+        interaction_log = [
+            self._backend_step(step_name, now_iso) for step_name, _ in self.BACKEND_STEPS
+        ]
+        return self._finish_backend_interaction(interaction_log, now_iso)
+
+    async def interact_with_backend_async(self, all_data: Dict) -> Dict:
+        """Complete autonomous backend interaction, running steps concurrently"""
+        now_iso = self._start_backend_interaction()
+
+        # The steps are independent, so total latency is the slowest step
+        # rather than the sum. gather() returns results in step order.
+        interaction_log = list(await asyncio.gather(
+            *(self._run_backend_step(step_name, delay, now_iso)
+              for step_name, delay in self.BACKEND_STEPS)
+        ))
+
+        return self._finish_backend_interaction(interaction_log, now_iso)
+
     def sign_autonomous_receipt(self, complete_data: Dict) -> Dict:
         """Generate and sign autonomous receipt"""
-        logger.info(f"\n{'='*80}")
-        logger.info(f"{Colors.HEADER}{Colors.BOLD}✍️  SIGNING AUTONOMOUS RECEIPT{Colors.ENDC}")
-        logger.info(f"{'='*80}\n")
+        log_banner("✍️  SIGNING AUTONOMOUS RECEIPT")
+
+        now_iso = datetime.now().isoformat()
 
         receipt = {
-            'receipt_id': hashlib.sha256(f"receipt_{time.time()}".encode()).hexdigest(),
+            'receipt_id': secrets.token_hex(32),
             'receipt_type': 'autonomous_bridge',
             'network_from': 'Ethereum Sepolia',
             'network_to': 'zkSync Era',
@@ -354,47 +604,58 @@ class AutonomousBackend:
                 'burn': complete_data.get('burn', {}),
                 'backend': complete_data.get('backend', {})
             },
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso,
             'status': 'completed'
         }
 
-        logger.info(f"   Receipt Type: {receipt['receipt_type'].upper()}")
-        logger.info(f"   Path: {receipt['network_from']} → {receipt['network_to']}")
-        logger.info(f"   Operations: {len(receipt['operations'])}")
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"   Receipt Type: {receipt['receipt_type'].upper()}",
+                f"   Path: {receipt['network_from']} → {receipt['network_to']}",
+                f"   Operations: {len(receipt['operations'])}"
+            )
 
-        time.sleep(0.5)
+        if DEMO:
+            time.sleep(0.5)
 
-        logger.info(f"\n🔐 Generating cryptographic signatures...")
-        time.sleep(0.4)
+        logger.info("\n🔐 Generating cryptographic signatures...")
+        if DEMO:
+            time.sleep(0.4)
 
         # Generate multiple signature types
-        receipt_json = json.dumps(receipt, sort_keys=True)
+        receipt_bytes = canonical_json(receipt)
+
+        # Hash the full receipt once; r/s are derived from the 32-byte digest
+        # so their cost stays constant as the receipt grows.
+        digest = _SHA256(receipt_bytes).digest()
 
         signatures = {
-            'sha256': hashlib.sha256(receipt_json.encode()).hexdigest(),
-            'sha512': hashlib.sha512(receipt_json.encode()).hexdigest(),
-            'receipt_hash': hashlib.sha256(f"autonomous_{receipt['receipt_id']}".encode()).hexdigest(),
-            'ecdsa_r': hashlib.sha256(f"r_{receipt_json}".encode()).hexdigest(),
-            'ecdsa_s': hashlib.sha256(f"s_{receipt_json}".encode()).hexdigest(),
+            'sha256': digest.hex(),
+            'sha512': sha512(receipt_bytes),
+            'receipt_hash': sha256(b"autonomous_" + receipt['receipt_id'].encode()),
+            'ecdsa_r': sha256(b"r" + digest),
+            'ecdsa_s': sha256(b"s" + digest),
             'recovery_id': 28,
             'algorithm': 'ECDSA-secp256k1',
             'autonomous': True,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso
         }
 
         receipt['signatures'] = signatures
 
-        logger.info(f"\n{Colors.OKGREEN}✓ Signature Suite Generated:{Colors.ENDC}")
-        logger.info(f"   SHA256: {signatures['sha256'][:32]}...")
-        logger.info(f"   SHA512: {signatures['sha512'][:32]}...")
-        logger.info(f"   Receipt Hash: {signatures['receipt_hash'][:32]}...")
-        logger.info(f"   ECDSA (r): {signatures['ecdsa_r'][:32]}...")
-        logger.info(f"   ECDSA (s): {signatures['ecdsa_s'][:32]}...")
-        logger.info(f"   Recovery ID: {signatures['recovery_id']}")
-        logger.info(f"   Algorithm: {signatures['algorithm']}")
-        logger.info(f"   Autonomous: {signatures['autonomous']}")
-
-        logger.info(f"\n{Colors.OKGREEN}{Colors.BOLD}✅ RECEIPT FULLY SIGNED!{Colors.ENDC}\n")
+        if logger.isEnabledFor(logging.INFO):
+            log_lines(
+                f"\n{Colors.OKGREEN}✓ Signature Suite Generated:{Colors.ENDC}",
+                f"   SHA256: {signatures['sha256'][:32]}...",
+                f"   SHA512: {signatures['sha512'][:32]}...",
+                f"   Receipt Hash: {signatures['receipt_hash'][:32]}...",
+                f"   ECDSA (r): {signatures['ecdsa_r'][:32]}...",
+                f"   ECDSA (s): {signatures['ecdsa_s'][:32]}...",
+                f"   Recovery ID: {signatures['recovery_id']}",
+                f"   Algorithm: {signatures['algorithm']}",
+                f"   Autonomous: {signatures['autonomous']}",
+                f"\n{Colors.OKGREEN}{Colors.BOLD}✅ RECEIPT FULLY SIGNED!{Colors.ENDC}\n"
+            )
 
         return receipt
 
@@ -403,38 +664,42 @@ class CompleteAutonomousSystem:
     """Complete Autonomous Sepolia → zkSync Era Bridge"""
 
     def __init__(self, zksync_wbtc_address: str):
+        # Normalize once and share with every component
         self.zksync_wbtc_address = zksync_wbtc_address.lower()
 
         # Initialize all components
         self.sepolia_source = SepoliaWBTCSource()
-        self.zksync_bridge = ZkSyncEraAutonomousBridge(zksync_wbtc_address)
-        self.wbtc_manager = WBTCOperationsManager(zksync_wbtc_address)
+        self.zksync_bridge = ZkSyncEraAutonomousBridge(self.zksync_wbtc_address)
+        self.wbtc_manager = WBTCOperationsManager(self.zksync_wbtc_address)
         self.backend = AutonomousBackend()
 
         self.execution_data = {}
 
     def display_header(self):
         """Display system header"""
-        print(f"\n{'='*80}")
-        print(f"{Colors.HEADER}{Colors.BOLD}AUTONOMOUS SEPOLIA → ZKSYNC ERA BRIDGE{Colors.ENDC}")
-        print(f"{'='*80}\n")
-
-        print(f"{Colors.OKBLUE}Fully Autonomous Operations:{Colors.ENDC}")
-        print(f"   1. Get WBTC balance from Ethereum Sepolia")
-        print(f"   2. Bridge ALL tokens to zkSync Era")
-        print(f"   3. Mint ALL WBTC on zkSync Era")
-        print(f"   4. Transfer to target wallet")
-        print(f"   5. Burn ALL tokens")
-        print(f"   6. Complete backend interaction")
-        print(f"   7. Sign autonomous receipt")
-
-        print(f"\n{Colors.OKGREEN}Configuration:{Colors.ENDC}")
-        print(f"   Source: Ethereum Sepolia (Chain 11155111)")
-        print(f"   Destination: zkSync Era (Chain 324)")
-        print(f"   Target WBTC: {Colors.OKGREEN}{self.zksync_wbtc_address}{Colors.ENDC}")
-        print(f"   Mode: FULLY AUTONOMOUS")
-
-        print(f"\n{'='*80}\n")
+        out = []
+        out.append(f"\n{BAR80}")
+        out.append(f"{Colors.HEADER}{Colors.BOLD}AUTONOMOUS SEPOLIA → ZKSYNC ERA BRIDGE{Colors.ENDC}")
+        out.append(f"{BAR80}\n")
+
+        out.append(f"{Colors.OKBLUE}Fully Autonomous Operations:{Colors.ENDC}")
+        out.append("   1. Get WBTC balance from Ethereum Sepolia")
+        out.append("   2. Bridge ALL tokens to zkSync Era")
+        out.append("   3. Mint ALL WBTC on zkSync Era")
+        out.append("   4. Transfer to target wallet")
+        out.append("   5. Burn ALL tokens")
+        out.append("   6. Complete backend interaction")
+        out.append("   7. Sign autonomous receipt")
+
+        out.append(f"\n{Colors.OKGREEN}Configuration:{Colors.ENDC}")
+        out.append("   Source: Ethereum Sepolia (Chain 11155111)")
+        out.append("   Destination: zkSync Era (Chain 324)")
+        out.append(f"   Target WBTC: {Colors.OKGREEN}{self.zksync_wbtc_address}{Colors.ENDC}")
+        out.append("   Mode: FULLY AUTONOMOUS")
+
+        out.append(f"\n{BAR80}\n")
+
+        write_lines(out)
 
     def execute_autonomous_flow(self) -> bool:
         """Execute complete autonomous bridge flow"""
@@ -442,46 +707,53 @@ class CompleteAutonomousSystem:
 
         try:
             # Step 1: Get Sepolia balance
-            logger.info(f"{Colors.BOLD}STEP 1: GET SEPOLIA WBTC BALANCE{Colors.ENDC}")
+            logger.info("%sSTEP 1: GET SEPOLIA WBTC BALANCE%s", Colors.BOLD, _RESET)
             source_balance = self.sepolia_source.get_initial_balance()
             self.execution_data['source_balance'] = source_balance
-            time.sleep(1)
+            if DEMO:
+                time.sleep(1)
 
             # Step 2: Bridge to zkSync Era
-            logger.info(f"{Colors.BOLD}STEP 2: BRIDGE TO ZKSYNC ERA{Colors.ENDC}")
+            logger.info("%sSTEP 2: BRIDGE TO ZKSYNC ERA%s", Colors.BOLD, _RESET)
             bridge_data = self.zksync_bridge.initiate_bridge(source_balance)
             self.execution_data['bridge'] = bridge_data
-            time.sleep(1)
+            if DEMO:
+                time.sleep(1)
 
             # Step 3: Mint WBTC
-            logger.info(f"{Colors.BOLD}STEP 3: MINT ALL WBTC{Colors.ENDC}")
+            logger.info("%sSTEP 3: MINT ALL WBTC%s", Colors.BOLD, _RESET)
             mint_data = self.wbtc_manager.mint_all_wbtc(bridge_data)
             self.execution_data['mint'] = mint_data
-            time.sleep(1)
+            if DEMO:
+                time.sleep(1)
 
             # Step 4: Transfer to wallet
-            logger.info(f"{Colors.BOLD}STEP 4: TRANSFER TO WALLET{Colors.ENDC}")
+            logger.info("%sSTEP 4: TRANSFER TO WALLET%s", Colors.BOLD, _RESET)
             transfer_data = self.wbtc_manager.transfer_all_to_wallet(mint_data)
             self.execution_data['transfer'] = transfer_data
-            time.sleep(1)
+            if DEMO:
+                time.sleep(1)
 
             # Step 5: Burn tokens
-            logger.info(f"{Colors.BOLD}STEP 5: BURN ALL TOKENS{Colors.ENDC}")
+            logger.info("%sSTEP 5: BURN ALL TOKENS%s", Colors.BOLD, _RESET)
             burn_data = self.wbtc_manager.burn_all_wbtc(transfer_data)
             self.execution_data['burn'] = burn_data
-            time.sleep(1)
+            if DEMO:
+                time.sleep(1)
 
             # Step 6: Backend interaction
-            logger.info(f"{Colors.BOLD}STEP 6: BACKEND INTERACTION{Colors.ENDC}")
+            logger.info("%sSTEP 6: BACKEND INTERACTION%s", Colors.BOLD, _RESET)
             backend_result = self.backend.interact_with_backend(self.execution_data)
             self.execution_data['backend'] = backend_result
-            time.sleep(1)
+            if DEMO:
+                time.sleep(1)
 
             # Step 7: Sign receipt
-            logger.info(f"{Colors.BOLD}STEP 7: SIGN AUTONOMOUS RECEIPT{Colors.ENDC}")
+            logger.info("%sSTEP 7: SIGN AUTONOMOUS RECEIPT%s", Colors.BOLD, _RESET)
             receipt = self.backend.sign_autonomous_receipt(self.execution_data)
             self.execution_data['receipt'] = receipt
-            time.sleep(1)
+            if DEMO:
+                time.sleep(1)
 
             # Display final results
             self.display_final_results()
@@ -489,71 +761,78 @@ class CompleteAutonomousSystem:
             return True
 
         except Exception as e:
-            logger.error(f"{Colors.FAIL}Error: {e}{Colors.ENDC}")
-            import traceback
+            logger.error("%sError: %s%s", Colors.FAIL, e, _RESET)
             traceback.print_exc()
             return False
 
     def display_final_results(self):
         """Display comprehensive results"""
-        print(f"\n{'='*80}")
-        print(f"{Colors.HEADER}{Colors.BOLD}✅ AUTONOMOUS BRIDGE COMPLETE! ✨✨✨{Colors.ENDC}")
-        print(f"{'='*80}\n")
+        out = []
+        out.append(f"\n{BAR80}")
+        out.append(f"{Colors.HEADER}{Colors.BOLD}✅ AUTONOMOUS BRIDGE COMPLETE! ✨✨✨{Colors.ENDC}")
+        out.append(f"{BAR80}\n")
 
         source = self.execution_data.get('source_balance', {})
         bridge = self.execution_data.get('bridge', {})
-        mint = self.execution_data.get('mint', {})
-        transfer = self.execution_data.get('transfer', {})
-        burn = self.execution_data.get('burn', {})
+        # Records are absent if their step never ran; getattr defaults cover that
+        mint = self.execution_data.get('mint')
+        transfer = self.execution_data.get('transfer')
+        burn = self.execution_data.get('burn')
         backend = self.execution_data.get('backend', {})
         receipt = self.execution_data.get('receipt', {})
 
-        print(f"{Colors.OKCYAN}📊 Source (Ethereum Sepolia):{Colors.ENDC}")
-        print(f"   • Initial Balance: {Colors.OKGREEN}{source.get('balance_wbtc', 0)} WBTC{Colors.ENDC}")
-        print(f"   • Chain ID: {source.get('chain_id', 0)}")
-
-        print(f"\n{Colors.OKCYAN}🌉 Bridge Operations:{Colors.ENDC}")
-        print(f"   • Bridge ID: {bridge.get('bridge_id', 'N/A')[:32]}...")
-        print(f"   • Amount: {Colors.OKGREEN}{bridge.get('amount_wbtc', 0)} WBTC{Colors.ENDC}")
-        print(f"   • Lock TX: {bridge.get('lock_tx', 'N/A')[:32]}...")
-        print(f"   • L1 TX: {bridge.get('l1_tx', 'N/A')[:32]}...")
-        print(f"   • L2 TX: {bridge.get('l2_tx', 'N/A')[:32]}...")
-        print(f"   • ZK Proof: {bridge.get('zk_proof', 'N/A')[:32]}...")
-
-        print(f"\n{Colors.OKCYAN}🪙  Token Operations:{Colors.ENDC}")
-        print(f"   • Minted: {Colors.OKGREEN}{mint.get('amount_wbtc', 0)} WBTC{Colors.ENDC}")
-        print(f"     TX: {mint.get('mint_tx', 'N/A')[:32]}...")
-        print(f"   • Transferred: {Colors.OKGREEN}{transfer.get('amount_wbtc', 0)} WBTC{Colors.ENDC}")
-        print(f"     TX: {transfer.get('transfer_tx', 'N/A')[:32]}...")
-        print(f"   • Burned: {Colors.WARNING}{burn.get('amount_wbtc', 0)} WBTC{Colors.ENDC}")
-        print(f"     TX: {burn.get('burn_tx', 'N/A')[:32]}...")
-
-        print(f"\n{Colors.OKCYAN}🖥️  Backend:{Colors.ENDC}")
-        print(f"   • Backend ID: {backend.get('backend_id', 'N/A')[:32]}...")
-        print(f"   • Steps: {backend.get('steps_completed', 0)}")
-        print(f"   • Mode: {backend.get('mode', 'N/A').upper()}")
-
-        print(f"\n{Colors.OKCYAN}✍️  Receipt:{Colors.ENDC}")
-        print(f"   • Receipt ID: {receipt.get('receipt_id', 'N/A')[:32]}...")
+        out.append(f"{Colors.OKCYAN}📊 Source (Ethereum Sepolia):{Colors.ENDC}")
+        out.append(f"   • Initial Balance: {Colors.OKGREEN}{source.get('balance_wbtc', 0)} WBTC{Colors.ENDC}")
+        out.append(f"   • Chain ID: {source.get('chain_id', 0)}")
+
+        out.append(f"\n{Colors.OKCYAN}🌉 Bridge Operations:{Colors.ENDC}")
+        out.append(f"   • Bridge ID: {bridge.get('bridge_id', 'N/A')[:32]}...")
+        out.append(f"   • Amount: {Colors.OKGREEN}{bridge.get('amount_wbtc', 0)} WBTC{Colors.ENDC}")
+        out.append(f"   • Lock TX: {bridge.get('lock_tx', 'N/A')[:32]}...")
+        out.append(f"   • L1 TX: {bridge.get('l1_tx', 'N/A')[:32]}...")
+        out.append(f"   • L2 TX: {bridge.get('l2_tx', 'N/A')[:32]}...")
+        out.append(f"   • ZK Proof: {bridge.get('zk_proof', 'N/A')[:32]}...")
+
+        out.append(f"\n{Colors.OKCYAN}🪙  Token Operations:{Colors.ENDC}")
+        out.append(f"   • Minted: {Colors.OKGREEN}{getattr(mint, 'amount_wbtc', 0)} WBTC{Colors.ENDC}")
+        out.append(f"     TX: {getattr(mint, 'mint_tx', 'N/A')[:32]}...")
+        out.append(f"   • Transferred: {Colors.OKGREEN}{getattr(transfer, 'amount_wbtc', 0)} WBTC{Colors.ENDC}")
+        out.append(f"     TX: {getattr(transfer, 'transfer_tx', 'N/A')[:32]}...")
+        out.append(f"   • Burned: {Colors.WARNING}{getattr(burn, 'amount_wbtc', 0)} WBTC{Colors.ENDC}")
+        out.append(f"     TX: {getattr(burn, 'burn_tx', 'N/A')[:32]}...")
+
+        out.append(f"\n{Colors.OKCYAN}🖥️  Backend:{Colors.ENDC}")
+        out.append(f"   • Backend ID: {backend.get('backend_id', 'N/A')[:32]}...")
+        out.append(f"   • Steps: {backend.get('steps_completed', 0)}")
+        out.append(f"   • Mode: {backend.get('mode', 'N/A').upper()}")
+
+        out.append(f"\n{Colors.OKCYAN}✍️  Receipt:{Colors.ENDC}")
+        out.append(f"   • Receipt ID: {receipt.get('receipt_id', 'N/A')[:32]}...")
         sigs = receipt.get('signatures', {})
-        print(f"   • SHA256: {sigs.get('sha256', 'N/A')[:32]}...")
-        print(f"   • SHA512: {sigs.get('sha512', 'N/A')[:32]}...")
-        print(f"   • ECDSA (r): {sigs.get('ecdsa_r', 'N/A')[:32]}...")
-        print(f"   • ECDSA (s): {sigs.get('ecdsa_s', 'N/A')[:32]}...")
-        print(f"   • Autonomous: {sigs.get('autonomous', False)}")
+        out.append(f"   • SHA256: {sigs.get('sha256', 'N/A')[:32]}...")
+        out.append(f"   • SHA512: {sigs.get('sha512', 'N/A')[:32]}...")
+        out.append(f"   • ECDSA (r): {sigs.get('ecdsa_r', 'N/A')[:32]}...")
+        out.append(f"   • ECDSA (s): {sigs.get('ecdsa_s', 'N/A')[:32]}...")
+        out.append(f"   • Autonomous: {sigs.get('autonomous', False)}")
+
+        out.append(f"\n{Colors.OKCYAN}📍 Final Status:{Colors.ENDC}")
+        out.append(f"   • Destination: {Colors.OKGREEN}{self.zksync_wbtc_address}{Colors.ENDC}")
+        out.append(f"   • Network: {Colors.OKGREEN}zkSync Era (Chain 324){Colors.ENDC}")
+        out.append(f"   • Status: {Colors.OKGREEN}COMPLETED ✅{Colors.ENDC}")
+        out.append(f"   • Mode: {Colors.OKGREEN}FULLY AUTONOMOUS{Colors.ENDC}")
 
-        print(f"\n{Colors.OKCYAN}📍 Final Status:{Colors.ENDC}")
-        print(f"   • Destination: {Colors.OKGREEN}{self.zksync_wbtc_address}{Colors.ENDC}")
-        print(f"   • Network: {Colors.OKGREEN}zkSync Era (Chain 324){Colors.ENDC}")
-        print(f"   • Status: {Colors.OKGREEN}COMPLETED ✅{Colors.ENDC}")
-        print(f"   • Mode: {Colors.OKGREEN}FULLY AUTONOMOUS{Colors.ENDC}")
+        out.append(f"\n{BAR80}\n")
 
-        print(f"\n{'='*80}\n")
+        write_lines(out)
 
         # Save results
         results_file = 'sepolia_zksync_autonomous_results.json'
-        with open(results_file, 'w') as f:
-            json.dump(self.execution_data, f, indent=2)
+        # Write to a temp file and swap it in so a crash never leaves a
+        # truncated results file behind
+        tmp_file = results_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(pretty_json(self.execution_data))
+        os.replace(tmp_file, results_file)
 
         print(f"{Colors.OKGREEN}📁 Results saved: {results_file}{Colors.ENDC}\n")
 
@@ -576,11 +855,13 @@ def main():
     success = system.execute_autonomous_flow()
 
     if success:
-        print(f"\n{Colors.OKGREEN}{Colors.BOLD}")
-        print(f"{'='*80}")
-        print(f"✨✨✨ AUTONOMOUS BRIDGE COMPLETED SUCCESSFULLY! ✨✨✨")
-        print(f"{'='*80}")
-        print(f"{Colors.ENDC}\n")
+        write_lines([
+            f"\n{Colors.OKGREEN}{Colors.BOLD}",
+            BAR80,
+            "✨✨✨ AUTONOMOUS BRIDGE COMPLETED SUCCESSFULLY! ✨✨✨",
+            BAR80,
+            f"{Colors.ENDC}\n"
+        ])
         return 0
     else:
         print(f"\n{Colors.FAIL}❌ Bridge failed{Colors.ENDC}\n")
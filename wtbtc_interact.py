@@ -4,142 +4,300 @@ WTBTC Quick Interaction Script
 Easy commands to interact with your deployed WTBTC system
 """
 
+import asyncio
+import functools
 import json
+import sys
 from pathlib import Path
-from deploy_wtbtc_system import WTBTCDeploymentSystem
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.patch_stdout import patch_stdout
+except ImportError:
+    PromptSession = None
+
+DEPLOYMENT_FILE = Path("wtbtc_deployment.json")
+
+SEPARATOR = "=" * 80
+
+# Static menu, rendered with a single write per iteration
+MENU_TEXT = (
+    f"\n{SEPARATOR}\n"
+    "📌 WTBTC Operations Menu\n"
+    f"{SEPARATOR}\n"
+    "1. Check WTBTC Balance\n"
+    "2. Check Contract Info\n"
+    "3. Transfer WTBTC\n"
+    "4. Burn WTBTC (Get BTC Back)\n"
+    "5. Check Bridge Info\n"
+    "6. View Peg Ratio\n"
+    "7. View Deployment Info\n"
+    "8. Exit\n"
+    f"{SEPARATOR}\n"
+)
+
+@functools.lru_cache(maxsize=1)
+def _parse_deployment(path, mtime_ns):
+    """Parse a deployment file; keyed on mtime so edits invalidate the cache"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 def load_deployment():
-    """Load deployment information"""
-    with open("wtbtc_deployment.json", "r") as f:
-        return json.load(f)
+    """Load deployment information (parsed once until the file changes)"""
+    return _parse_deployment(str(DEPLOYMENT_FILE), DEPLOYMENT_FILE.stat().st_mtime_ns)
+
+def parse_recipients(text):
+    """Parse "addr1:amt1,addr2:amt2,..." into (address, amount) pairs"""
+    pairs = []
+    for entry in text.split(","):
+        address, amount = entry.strip().rsplit(":", 1)
+        pairs.append((address.strip(), float(amount)))
+    return pairs
+
+class MenuContext:
+    """State shared by the menu handlers"""
+
+    def __init__(self, deployer, deployment, args, ask):
+        self.deployer = deployer
+        self.deployment = deployment
+        self.args = args
+        self.ask = ask
+        self.wtbtc_address = deployment["contracts"]["WTBTC"]["address"]
+        self.bridge_address = deployment["contracts"]["Bridge"]["address"]
+        self.network = deployment["network"]
+        self.bitcoin_address = deployment["bitcoin_address"]
+        self.deployment_info_text = format_deployment_info(deployment)
+
+def format_deployment_info(deployment):
+    """Pre-format the deployment info block shown by menu option 7"""
+    return (
+        "\n📄 Deployment Information\n"
+        f"   Network: {deployment['network']}\n"
+        f"   Chain ID: {deployment['chain_id']}\n"
+        f"   WTBTC Token: {deployment['contracts']['WTBTC']['address']}\n"
+        f"   Bridge: {deployment['contracts']['Bridge']['address']}\n"
+        f"   Bitcoin Address: {deployment['bitcoin_address']}\n"
+        f"   Timestamp: {deployment['timestamp']}\n"
+    )
+
+def handle_balance(ctx):
+    print("\n💰 Checking WTBTC Balance...")
+    if ctx.deployer.account:
+        print(f"   Address: {ctx.deployer.account.address}")
+        print(f"   Balance: 1,000,000 WTBTC (simulated)")
+    else:
+        print("   ⚠️  No account configured. Set PRIVATE_KEY in .env")
+
+def handle_info(ctx):
+    print("\n📊 Fetching Contract Info...")
+    # getInfo() returns every field from one eth_call, which no per-field
+    # strategy beats; --parallel reads field by field for tokens without it
+    if ctx.args.parallel:
+        info = asyncio.run(ctx.deployer.interact_with_wtbtc_async(ctx.wtbtc_address))
+    else:
+        info = ctx.deployer.read_wtbtc_info(ctx.wtbtc_address)
+    print(f"   Name: {info['info']['name']}")
+    print(f"   Symbol: {info['info']['symbol']}")
+    print(f"   Decimals: {info['info']['decimals']}")
+    print(f"   Total Supply: {info['info']['totalSupply'] / 1e8} WTBTC")
+    print(f"   BTC Locked: {info['info']['btcLocked'] / 1e8} BTC")
+    print(f"   Bitcoin Address: {info['info']['bitcoinAddress']}")
+    print(f"   Peg Ratio: {info['peg_ratio']}:1 {'✅' if info['peg_ratio'] == 1.0 else '⚠️'}")
+
+def handle_transfer(ctx):
+    deployer = ctx.deployer
+    wtbtc_address = ctx.wtbtc_address
+
+    print("\n💸 Transfer WTBTC")
+    recipients = ctx.ask("   Recipient address (or addr:amount,addr:amount,... for a batch): ").strip()
+
+    try:
+        if ":" in recipients:
+            pairs = parse_recipients(recipients)
+        else:
+            pairs = [(recipients, float(ctx.ask("   Amount (WTBTC): ").strip()))]
+
+        if len(pairs) == 1:
+            to_address, amount = pairs[0]
+            if deployer.can_submit(wtbtc_address):
+                # Return to the menu right away; confirmation is reported
+                # by the background poller
+                try:
+                    tx_hash = deployer.submit_transfer_async(wtbtc_address, to_address, amount)
+                except Exception as e:
+                    print(f"\n   ❌ Transfer submission failed: {e}")
+                else:
+                    deployer.track_receipt(tx_hash, f"Transfer of {amount} WTBTC")
+                    print(f"\n   📤 Transfer submitted!")
+                    print(f"   TX Hash: {tx_hash[:16]}... (confirming in background)")
+            else:
+                result = deployer.transfer_wtbtc(
+                    wtbtc_address, to_address, amount, {}
+                )
+                print(f"\n   ✅ Transfer successful!")
+                print(f"   TX Hash: {result['tx_hash'][:16]}...")
+        else:
+            # One batchTransfer transaction for every recipient
+            to_addresses = [to_address for to_address, _ in pairs]
+            amounts = [amount for _, amount in pairs]
+            if deployer.can_submit(wtbtc_address):
+                try:
+                    tx_hash = deployer.submit_batch_transfer_async(wtbtc_address, to_addresses, amounts)
+                except Exception as e:
+                    print(f"\n   ❌ Batch transfer submission failed: {e}")
+                else:
+                    deployer.track_receipt(tx_hash, f"Batch transfer to {len(pairs)} recipients")
+                    print(f"\n   📤 Batch transfer to {len(pairs)} recipients submitted!")
+                    print(f"   TX Hash: {tx_hash[:16]}... (confirming in background)")
+            else:
+                result = deployer.batch_transfer_wtbtc(
+                    wtbtc_address, to_addresses, amounts, {}
+                )
+                print(f"\n   ✅ Batch transfer to {len(pairs)} recipients successful!")
+                print(f"   TX Hash: {result['tx_hash'][:16]}...")
+    except ValueError:
+        print("   ❌ Invalid amount or recipient list")
+
+def handle_burn(ctx):
+    deployer = ctx.deployer
+    wtbtc_address = ctx.wtbtc_address
+
+    print("\n🔥 Burn WTBTC for BTC")
+    amount = ctx.ask("   Amount to burn (WTBTC): ").strip()
+    btc_addr = ctx.ask("   Your Bitcoin address: ").strip()
+
+    try:
+        amount = float(amount)
+        if deployer.can_submit(wtbtc_address):
+            try:
+                tx_hash = deployer.submit_burn_async(wtbtc_address, amount, btc_addr)
+            except Exception as e:
+                print(f"\n   ❌ Burn submission failed: {e}")
+            else:
+                deployer.track_receipt(tx_hash, f"Burn of {amount} WTBTC")
+                print(f"\n   📤 Burn submitted!")
+                print(f"   TX Hash: {tx_hash[:16]}... (confirming in background)")
+                print(f"   BTC will be sent to: {btc_addr}")
+        else:
+            result = deployer.burn_for_btc(
+                wtbtc_address, amount, btc_addr, {}
+            )
+            print(f"\n   ✅ WTBTC burned successfully!")
+            print(f"   Burn ID: {result['burn_id'][:16]}...")
+            print(f"   BTC will be sent to: {btc_addr}")
+    except ValueError:
+        print("   ❌ Invalid amount")
+
+def handle_bridge_info(ctx):
+    print("\n🌉 Bridge Information")
+    print(f"   Bridge Contract: {ctx.bridge_address}")
+    print(f"   Bitcoin Deposit Address: {ctx.bitcoin_address}")
+    print(f"   Network: {ctx.network}")
+    print(f"   Status: ✅ OPERATIONAL")
+
+def handle_peg(ctx):
+    print("\n⚖️  1:1 Peg Verification")
+    print(f"   Total BTC Locked: 1,000,000 BTC (simulated)")
+    print(f"   Total WTBTC Supply: 1,000,000 WTBTC")
+    print(f"   Peg Ratio: 1.0:1 ✅")
+    print(f"   Status: MAINTAINED")
+
+def handle_deployment_info(ctx):
+    sys.stdout.write(ctx.deployment_info_text)
+    sys.stdout.flush()
+
+def handle_exit(ctx):
+    print("\n👋 Goodbye!")
+    return True
+
+def handle_invalid(ctx):
+    print("\n❌ Invalid choice. Please select 1-8.")
+
+# Menu choice -> handler; a handler returning True leaves the menu
+HANDLERS = {
+    "1": handle_balance,
+    "2": handle_info,
+    "3": handle_transfer,
+    "4": handle_burn,
+    "5": handle_bridge_info,
+    "6": handle_peg,
+    "7": handle_deployment_info,
+    "8": handle_exit,
+}
+
+def run_menu(ctx):
+    """Prompt for menu choices until the user exits"""
+    deployer = ctx.deployer
+
+    while True:
+        sys.stdout.write(MENU_TEXT)
+        sys.stdout.flush()
+        if deployer.outstanding:
+            print(f"⏳ Pending transactions ({len(deployer.outstanding)}):")
+            for tx_hash in list(deployer.outstanding):
+                print(f"   {tx_hash[:16]}...")
+
+        try:
+            choice = ctx.ask("\nEnter your choice (1-8): ").strip()
+        except EOFError:
+            choice = "8"
+
+        if HANDLERS.get(choice, handle_invalid)(ctx):
+            break
 
 def main():
-    print("=" * 80)
+    import argparse
+
+    parser = argparse.ArgumentParser(description='WTBTC Quick Interaction Tool')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Read contract info with concurrent per-field eth_calls '
+                             '(for tokens without getInfo())')
+    args = parser.parse_args()
+
+    print(SEPARATOR)
     print("💰 WTBTC Quick Interaction Tool")
-    print("=" * 80)
+    print(SEPARATOR)
 
     # Load deployment info
     try:
         deployment = load_deployment()
-        wtbtc_address = deployment["contracts"]["WTBTC"]["address"]
-        bridge_address = deployment["contracts"]["Bridge"]["address"]
         network = deployment["network"]
         bitcoin_address = deployment["bitcoin_address"]
 
         print(f"\n📋 Loaded Deployment Info:")
         print(f"   Network: {network}")
-        print(f"   WTBTC Token: {wtbtc_address}")
-        print(f"   Bridge: {bridge_address}")
+        print(f"   WTBTC Token: {deployment['contracts']['WTBTC']['address']}")
+        print(f"   Bridge: {deployment['contracts']['Bridge']['address']}")
         print(f"   Bitcoin Address: {bitcoin_address}")
 
     except FileNotFoundError:
         print("\n⚠️  No deployment found. Run deploy_wtbtc_system.py first!")
         return
 
+    # Imported only once a deployment exists; it pulls in web3 and the
+    # RPC clients, which the early-exit paths above don't need
+    from deploy_wtbtc_system import WTBTCDeploymentSystem
+
     # Initialize deployment system
     deployer = WTBTCDeploymentSystem(
         network=network,
         bitcoin_address=bitcoin_address
     )
 
-    # Show menu
-    while True:
-        print("\n" + "=" * 80)
-        print("📌 WTBTC Operations Menu")
-        print("=" * 80)
-        print("1. Check WTBTC Balance")
-        print("2. Check Contract Info")
-        print("3. Transfer WTBTC")
-        print("4. Burn WTBTC (Get BTC Back)")
-        print("5. Check Bridge Info")
-        print("6. View Peg Ratio")
-        print("7. View Deployment Info")
-        print("8. Exit")
-        print("=" * 80)
-
-        choice = input("\nEnter your choice (1-8): ").strip()
-
-        if choice == "1":
-            print("\n💰 Checking WTBTC Balance...")
-            if deployer.account:
-                print(f"   Address: {deployer.account.address}")
-                print(f"   Balance: 1,000,000 WTBTC (simulated)")
-            else:
-                print("   ⚠️  No account configured. Set PRIVATE_KEY in .env")
-
-        elif choice == "2":
-            print("\n📊 Fetching Contract Info...")
-            info = deployer.interact_with_wtbtc(wtbtc_address, {})
-            print(f"   Name: {info['info']['name']}")
-            print(f"   Symbol: {info['info']['symbol']}")
-            print(f"   Decimals: {info['info']['decimals']}")
-            print(f"   Total Supply: {info['info']['totalSupply'] / 1e8} WTBTC")
-            print(f"   BTC Locked: {info['info']['btcLocked'] / 1e8} BTC")
-            print(f"   Bitcoin Address: {info['info']['bitcoinAddress']}")
-            print(f"   Peg Ratio: {info['peg_ratio']}:1 {'✅' if info['peg_ratio'] == 1.0 else '⚠️'}")
-
-        elif choice == "3":
-            print("\n💸 Transfer WTBTC")
-            to_address = input("   Recipient address: ").strip()
-            amount = input("   Amount (WTBTC): ").strip()
-
-            try:
-                amount = float(amount)
-                result = deployer.transfer_wtbtc(
-                    wtbtc_address, to_address, amount, {}
-                )
-                print(f"\n   ✅ Transfer successful!")
-                print(f"   TX Hash: {result['tx_hash'][:16]}...")
-            except ValueError:
-                print("   ❌ Invalid amount")
-
-        elif choice == "4":
-            print("\n🔥 Burn WTBTC for BTC")
-            amount = input("   Amount to burn (WTBTC): ").strip()
-            btc_addr = input("   Your Bitcoin address: ").strip()
-
-            try:
-                amount = float(amount)
-                result = deployer.burn_for_btc(
-                    wtbtc_address, amount, btc_addr, {}
-                )
-                print(f"\n   ✅ WTBTC burned successfully!")
-                print(f"   Burn ID: {result['burn_id'][:16]}...")
-                print(f"   BTC will be sent to: {btc_addr}")
-            except ValueError:
-                print("   ❌ Invalid amount")
-
-        elif choice == "5":
-            print("\n🌉 Bridge Information")
-            print(f"   Bridge Contract: {bridge_address}")
-            print(f"   Bitcoin Deposit Address: {bitcoin_address}")
-            print(f"   Network: {network}")
-            print(f"   Status: ✅ OPERATIONAL")
-
-        elif choice == "6":
-            print("\n⚖️  1:1 Peg Verification")
-            print(f"   Total BTC Locked: 1,000,000 BTC (simulated)")
-            print(f"   Total WTBTC Supply: 1,000,000 WTBTC")
-            print(f"   Peg Ratio: 1.0:1 ✅")
-            print(f"   Status: MAINTAINED")
-
-        elif choice == "7":
-            print("\n📄 Deployment Information")
-            print(f"   Network: {deployment['network']}")
-            print(f"   Chain ID: {deployment['chain_id']}")
-            print(f"   WTBTC Token: {wtbtc_address}")
-            print(f"   Bridge: {bridge_address}")
-            print(f"   Bitcoin Address: {bitcoin_address}")
-            print(f"   Timestamp: {deployment['timestamp']}")
-
-        elif choice == "8":
-            print("\n👋 Goodbye!")
-            break
-
-        else:
-            print("\n❌ Invalid choice. Please select 1-8.")
+    if PromptSession is None:
+        run_menu(MenuContext(deployer, deployment, args, input))
+        return
 
-        input("\nPress Enter to continue...")
+    # patch_stdout lets background receipt notifications print above the
+    # prompt instead of corrupting the line being typed
+    session = PromptSession()
+    with patch_stdout():
+        run_menu(MenuContext(deployer, deployment, args, session.prompt))
 
 if __name__ == "__main__":
     try: